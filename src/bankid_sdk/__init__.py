@@ -1,33 +1,40 @@
-from ._actions import (
-    Action,
-    AuthAction,
-    FinalizeFailed,
-    InitFailed,
-    SignAction,
-    UserAuthData,
-    UserSignData,
-)
-from ._auth import init_auth
-from ._cancel import cancel
-from ._client import AsyncV60, SyncV60
-from ._collect import (
-    CompleteCollect,
-    CompletionData,
-    Device,
-    FailedCollect,
-    FailedHintCode,
-    PendingCollect,
-    PendingHintCode,
-    TransactionExpired,
-    User,
-    check,
-)
-from ._config import config, configure
-from ._order import OrderRequest, OrderResponse, Transaction, generate_qr_code
-from ._requirement import Requirement
-from ._storage import MemoryStorage
-from .errors import BankIDAPIError, BankIDHTTPError
-from .typing import OrderRef, PersonalNumber, TransactionID
+from __future__ import annotations
+
+import importlib
+from functools import cache
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from ._actions import (
+        Action,
+        AuthAction,
+        FinalizeFailed,
+        InitFailed,
+        SignAction,
+        UserAuthData,
+        UserSignData,
+    )
+    from ._auth import init_auth
+    from ._cancel import acancel, cancel
+    from ._client import AsyncV60, SyncV60
+    from ._collect import (
+        CompleteCollect,
+        CompletionData,
+        Device,
+        FailedCollect,
+        FailedHintCode,
+        PendingCollect,
+        PendingHintCode,
+        TransactionExpired,
+        User,
+        check,
+    )
+    from ._config import config, configure
+    from ._order import OrderRequest, OrderResponse, Transaction, generate_qr_code
+    from ._requirement import Requirement
+    from ._storage import MemoryStorage
+    from .errors import BankIDAPIError, BankIDHTTPError
+    from .typing import OrderRef, PersonalNumber, TransactionID
 
 try:
     from ._version import __version__
@@ -64,6 +71,7 @@ __all__ = [
     "User",
     "UserAuthData",
     "UserSignData",
+    "acancel",
     "cancel",
     "check",
     "config",
@@ -71,3 +79,66 @@ __all__ = [
     "generate_qr_code",
     "init_auth",
 ]
+
+# Maps each public name to the submodule defining it. Submodules are only imported
+# once one of their names is accessed (PEP 562), keeping 'import bankid_sdk' cheap.
+_LAZY: Final = {
+    "Action": "._actions",
+    "AuthAction": "._actions",
+    "FinalizeFailed": "._actions",
+    "InitFailed": "._actions",
+    "SignAction": "._actions",
+    "UserAuthData": "._actions",
+    "UserSignData": "._actions",
+    "init_auth": "._auth",
+    "acancel": "._cancel",
+    "cancel": "._cancel",
+    "AsyncV60": "._client",
+    "SyncV60": "._client",
+    "CompleteCollect": "._collect",
+    "CompletionData": "._collect",
+    "Device": "._collect",
+    "FailedCollect": "._collect",
+    "FailedHintCode": "._collect",
+    "PendingCollect": "._collect",
+    "PendingHintCode": "._collect",
+    "TransactionExpired": "._collect",
+    "User": "._collect",
+    "check": "._collect",
+    "config": "._config",
+    "configure": "._config",
+    "OrderRequest": "._order",
+    "OrderResponse": "._order",
+    "Transaction": "._order",
+    "generate_qr_code": "._order",
+    "Requirement": "._requirement",
+    "MemoryStorage": "._storage",
+    "BankIDAPIError": ".errors",
+    "BankIDHTTPError": ".errors",
+    "OrderRef": ".typing",
+    "PersonalNumber": ".typing",
+    "TransactionID": ".typing",
+}
+# Public submodules, reachable as attributes without an explicit import
+_SUBMODULES: Final = frozenset({"errors", "typing", "utils"})
+
+
+@cache
+def _resolve(name: str) -> Any:
+    return getattr(importlib.import_module(_LAZY[name], __name__), name)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    obj = _resolve(name)
+    # Cache on the module so any later access bypasses '__getattr__'
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,29 +1,32 @@
 from __future__ import annotations
 
 from base64 import b64encode
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple
 
 from ._actions import AuthAction
 from ._config import config
 from ._order import OrderRequest, Transaction
 from ._requirement import Requirement, _build_requirement_data
 from .typing import Base64, TransactionID
+from .utils import base64_length
 
 if TYPE_CHECKING:
     from ._client import SyncV60
 
 
+USER_DATA_MAX_LENGTH: Final = 1_500
+
+
 def encode_user_data(value: str | None, /) -> Base64 | None:
     if not value:
         return None
 
-    encoded = b64encode(value.encode())
-    length = len(encoded)
-    user_data_max_length = 1_500
-    if length > user_data_max_length:
+    raw = value.encode()
+    length = base64_length(len(raw))
+    if length > USER_DATA_MAX_LENGTH:
         raise ValueError(f"User data too large ({length})")
 
-    return Base64(encoded.decode())
+    return Base64(b64encode(raw).decode("ascii"))
 
 
 def build_auth_request(
@@ -34,15 +37,13 @@ def build_auth_request(
     user_visible_data_format: Literal["simpleMarkdownV1"] | None = None,
 ) -> dict[str, Any]:
     data: dict[str, Any] = {"endUserIp": end_user_ip}
-    for key, option in [
+    options = (
         ("requirement", _build_requirement_data(requirement)),
         ("userVisibleData", encode_user_data(user_visible_data)),
         ("userNonVisibleData", encode_user_data(user_non_visible_data)),
         ("userVisibleDataFormat", user_visible_data_format),
-    ]:
-        if option is not None:
-            data[key] = option
-
+    )
+    data.update((key, option) for key, option in options if option is not None)
     return data
 
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ._config import config
+from ._storage import adelete, aload
 from .typing import TransactionID
 
 if TYPE_CHECKING:
-    from ._client import SyncV60
+    from ._client import AsyncV60, SyncV60
 
 
 def cancel(client: SyncV60, transaction_id: TransactionID) -> None:
@@ -17,3 +18,12 @@ def cancel(client: SyncV60, transaction_id: TransactionID) -> None:
 
     client.cancel(transaction.order_response.order_ref)
     config.STORAGE.delete(transaction_id)
+
+
+async def acancel(client: AsyncV60, transaction_id: TransactionID) -> None:
+    transaction = await aload(config.STORAGE, transaction_id)
+    if transaction is None:
+        return
+
+    await client.cancel(transaction.order_response.order_ref)
+    await adelete(config.STORAGE, transaction_id)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from collections.abc import Awaitable, Callable, Generator, Iterable
-from contextlib import AbstractContextManager, ExitStack, contextmanager
+import json
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from contextlib import AbstractContextManager, ExitStack, nullcontext
 from functools import wraps
+from types import TracebackType
 from typing import (
     Any,
     Final,
@@ -13,7 +14,6 @@ from typing import (
     TypeVar,
     overload,
 )
-from urllib.parse import urljoin
 
 import httpx
 from typing_extensions import Concatenate, ParamSpec, Self
@@ -25,30 +25,64 @@ from ._collect import (
     PendingCollect,
     process_collect_response,
 )
+from ._config import config
 from ._order import OrderResponse, process_order_response
 from ._requirement import Requirement
 from ._sign import build_sign_request
-from .errors import httpx_error_hook
+from .errors import translate_httpx_error
 from .typing import OrderRef
 
+# Connection settings for the default clients. Connections are kept alive to be
+# reused by the repeated collect calls of an order flow.
+DEFAULT_LIMITS: Final = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+DEFAULT_TIMEOUT: Final = httpx.Timeout(10.0, connect=3.0)
+
 
 class GetExcHooks(Protocol):
-    def get_exc_hooks(self) -> Iterable[AbstractContextManager[Any]]:
+    def get_exc_hooks(self) -> Sequence[AbstractContextManager[Any]]:
         ...
 
 
-@contextmanager
-def context_bundle(
-    managers: Iterable[AbstractContextManager[Any]], /
-) -> Generator[ExitStack, None, None]:
+class context_bundle:
     """
     Bundles given context managers to a single one. Contexts are activated in passed
     in order.
     """
-    with ExitStack() as stack:
-        for manager in managers:
-            stack.enter_context(manager)
-        yield stack
+
+    __slots__ = ("managers", "stack")
+
+    def __init__(self, managers: Iterable[AbstractContextManager[Any]], /) -> None:
+        self.managers = managers
+
+    def __enter__(self) -> ExitStack:
+        with ExitStack() as stack:
+            for manager in self.managers:
+                stack.enter_context(manager)
+            # Only take over the entered contexts once all of them are active.
+            self.stack = stack.pop_all()
+        return self.stack
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        return self.stack.__exit__(exc_type, exc_value, traceback)
+
+
+def activate_hooks(
+    hooks: Sequence[AbstractContextManager[Any]], /
+) -> AbstractContextManager[Any]:
+    """
+    Returns a single context manager activating all given hooks. Skips bundling for
+    the common cases of none or a lone hook.
+    """
+    if not hooks:
+        return nullcontext()
+    elif len(hooks) == 1:
+        return hooks[0]
+    return context_bundle(hooks)
 
 
 P = ParamSpec("P")
@@ -79,30 +113,52 @@ def handle_exception(
     if asyncio.iscoroutinefunction(method):
 
         async def adecorator(self: _Client, /, *args: P.args, **kwargs: P.kwargs) -> T:
-            with context_bundle(self.get_exc_hooks()):
-                return await method(self, *args, **kwargs)  # type: ignore[no-any-return]
+            with activate_hooks(self.get_exc_hooks()):
+                # Translating httpx errors is always the innermost(first) handling
+                try:
+                    return await method(self, *args, **kwargs)  # type: ignore[no-any-return]
+                except httpx.HTTPError as exc:
+                    raise translate_httpx_error(exc) from exc
 
         return adecorator
     else:
 
         @wraps(method)
         def decorator(self: _Client, /, *args: P.args, **kwargs: P.kwargs) -> T:
-            with context_bundle(self.get_exc_hooks()):
-                return method(self, *args, **kwargs)
+            with activate_hooks(self.get_exc_hooks()):
+                # Translating httpx errors is always the innermost(first) handling
+                try:
+                    return method(self, *args, **kwargs)
+                except httpx.HTTPError as exc:
+                    raise translate_httpx_error(exc) from exc
 
         return decorator
 
 
+def order_ref_body(order_ref: OrderRef, /) -> bytes:
+    """
+    Serializes the '{"orderRef": ...}' payload used by collect and cancel, only
+    encoding the variable part.
+    """
+    return b'{"orderRef":' + json.dumps(order_ref).encode() + b"}"
+
+
 class V60Base:
     __slots__ = ("headers", "_exc_hooks")
     path_prefix: Final[str] = "/rp/v6.0/"
+    AUTH_PATH: Final = path_prefix + "auth"
+    SIGN_PATH: Final = path_prefix + "sign"
+    COLLECT_PATH: Final = path_prefix + "collect"
+    CANCEL_PATH: Final = path_prefix + "cancel"
 
     def __init__(self) -> None:
-        self.headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        self._exc_hooks = deque[AbstractContextManager[Any]]()
+        self.headers = httpx.Headers(
+            {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+        )
+        self._exc_hooks: list[AbstractContextManager[Any]] = []
 
     def handle(self, exc_hook: AbstractContextManager[Any], /) -> Self:
         """
@@ -113,15 +169,12 @@ class V60Base:
         self._exc_hooks.append(exc_hook)
         return self
 
-    def get_exc_hooks(self) -> Generator[AbstractContextManager[Any], None, None]:
-        for _ in range(len(self._exc_hooks)):
-            yield self._exc_hooks.popleft()
-
-        # Always keep the default httpx handler as the innermost(first) hook.
-        yield httpx_error_hook()
+    def get_exc_hooks(self) -> list[AbstractContextManager[Any]]:
+        hooks, self._exc_hooks = self._exc_hooks, []
+        return hooks
 
     def build_path(self, component: str) -> str:
-        return urljoin(self.path_prefix, component.lstrip("/"))
+        return self.path_prefix + component.lstrip("/")
 
 
 class AsyncV60(V60Base):
@@ -131,6 +184,24 @@ class AsyncV60(V60Base):
         super().__init__()
         self.client = client
 
+    @classmethod
+    def default_client(cls, *, http2: bool = False) -> httpx.AsyncClient:
+        """
+        Creates an async HTTP client from configured values. Connections are kept
+        alive to be reused by the repeated collect calls of an order flow.
+
+        Passing 'http2=True' multiplexes concurrent requests over a single
+        connection, it requires the 'http2' extra to be installed.
+        """
+        return httpx.AsyncClient(
+            base_url=config.API_BASE_URL,
+            cert=config.CERT,
+            verify=config.CA_CERT,
+            http2=http2,
+            limits=DEFAULT_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+        )
+
     @handle_exception
     async def auth(
         self,
@@ -148,7 +219,7 @@ class AsyncV60(V60Base):
             user_visible_data_format,
         )
         response = await self.client.post(
-            self.build_path("/auth"), json=data, headers=self.headers
+            self.AUTH_PATH, json=data, headers=self.headers
         )
         return process_order_response(response)
 
@@ -169,7 +240,7 @@ class AsyncV60(V60Base):
             user_visible_data_format,
         )
         response = await self.client.post(
-            self.build_path("/sign"), json=data, headers=self.headers
+            self.SIGN_PATH, json=data, headers=self.headers
         )
         return process_order_response(response)
 
@@ -178,8 +249,8 @@ class AsyncV60(V60Base):
         self, order_ref: OrderRef
     ) -> PendingCollect | CompleteCollect | FailedCollect:
         response = await self.client.post(
-            self.build_path("/collect"),
-            json={"orderRef": order_ref},
+            self.COLLECT_PATH,
+            content=order_ref_body(order_ref),
             headers=self.headers,
         )
         return process_collect_response(response)
@@ -187,8 +258,8 @@ class AsyncV60(V60Base):
     @handle_exception
     async def cancel(self, order_ref: OrderRef) -> None:
         response = await self.client.post(
-            self.build_path("/cancel"),
-            json={"orderRef": order_ref},
+            self.CANCEL_PATH,
+            content=order_ref_body(order_ref),
             headers=self.headers,
         )
         response.raise_for_status()
@@ -201,6 +272,20 @@ class SyncV60(V60Base):
         super().__init__()
         self.client = client
 
+    @classmethod
+    def default_client(cls) -> httpx.Client:
+        """
+        Creates a HTTP client from configured values, with the same connection
+        settings as 'AsyncV60.default_client'.
+        """
+        return httpx.Client(
+            base_url=config.API_BASE_URL,
+            cert=config.CERT,
+            verify=config.CA_CERT,
+            limits=DEFAULT_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+        )
+
     @handle_exception
     def auth(
         self,
@@ -217,9 +302,7 @@ class SyncV60(V60Base):
             user_non_visible_data,
             user_visible_data_format,
         )
-        response = self.client.post(
-            self.build_path("/auth"), json=data, headers=self.headers
-        )
+        response = self.client.post(self.AUTH_PATH, json=data, headers=self.headers)
         return process_order_response(response)
 
     @handle_exception
@@ -238,9 +321,7 @@ class SyncV60(V60Base):
             user_non_visible_data,
             user_visible_data_format,
         )
-        response = self.client.post(
-            self.build_path("/sign"), json=data, headers=self.headers
-        )
+        response = self.client.post(self.SIGN_PATH, json=data, headers=self.headers)
         return process_order_response(response)
 
     @handle_exception
@@ -248,8 +329,8 @@ class SyncV60(V60Base):
         self, order_ref: OrderRef
     ) -> PendingCollect | CompleteCollect | FailedCollect:
         response = self.client.post(
-            self.build_path("/collect"),
-            json={"orderRef": order_ref},
+            self.COLLECT_PATH,
+            content=order_ref_body(order_ref),
             headers=self.headers,
         )
         return process_collect_response(response)
@@ -257,8 +338,8 @@ class SyncV60(V60Base):
     @handle_exception
     def cancel(self, order_ref: OrderRef) -> None:
         response = self.client.post(
-            self.build_path("/cancel"),
-            json={"orderRef": order_ref},
+            self.CANCEL_PATH,
+            content=order_ref_body(order_ref),
             headers=self.headers,
         )
         response.raise_for_status()
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Final, Union
 
 import httpx
-from typing_extensions import TypeAlias, assert_never
+from typing_extensions import TypeAlias
 
 from ._config import config
 from ._order import generate_qr_code
 from .typing import OrderRef, PersonalNumber, TransactionID
+from .utils import dataclass_slots
 
 if TYPE_CHECKING:
     from ._client import SyncV60
@@ -44,7 +47,7 @@ class FailedHintCode(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class User:
     personal_number: PersonalNumber
     name: str
@@ -52,18 +55,18 @@ class User:
     surname: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class Device:
     ip_address: str
     uhi: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class StepUp:
     mrtd: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class CompletionData:
     user: User
     device: Device
@@ -73,19 +76,19 @@ class CompletionData:
     ocsp_response: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class PendingCollect:
     order_ref: OrderRef
     hint_code: PendingHintCode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class CompleteCollect:
     order_ref: OrderRef
     completion_data: CompletionData
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class FailedCollect:
     order_ref: OrderRef
     hint_code: FailedHintCode
@@ -94,58 +97,86 @@ class FailedCollect:
 CollectResponse: TypeAlias = Union[PendingCollect, CompleteCollect, FailedCollect]
 
 
-def process_collect_response(response: httpx.Response) -> CollectResponse:
-    response.raise_for_status()
-    response_data: dict[str, Any] = response.json()
-    status = CollectStatus(response_data["status"])
-    order_ref = OrderRef(response_data["orderRef"])
-
-    hint_code: PendingHintCode | FailedHintCode
-    if status is CollectStatus.PENDING:
-        try:
-            hint_code = PendingHintCode(response_data["hintCode"])
-        except ValueError:
-            hint_code = PendingHintCode.UNKNOWN
-        return PendingCollect(order_ref=order_ref, hint_code=hint_code)
-
-    elif status is CollectStatus.COMPLETE:
-        completion_data = response_data["completionData"]
-        user = completion_data["user"]
-        device = completion_data["device"]
-        step_up = completion_data.get("stepUp")
-        return CompleteCollect(
-            order_ref=order_ref,
-            completion_data=CompletionData(
-                user=User(
-                    personal_number=PersonalNumber(str(user["personalNumber"])),
-                    name=str(user["name"]),
-                    given_name=str(user["givenName"]),
-                    surname=str(user["surname"]),
-                ),
-                device=Device(
-                    ip_address=str(device["ipAddress"]), uhi=device.get("uhi")
-                ),
-                bankid_issue_date=completion_data["bankIdIssueDate"],
-                step_up=StepUp(mrtd=step_up["mrtd"]) if step_up is not None else None,
-                signature=completion_data["signature"],
-                ocsp_response=completion_data["ocspResponse"],
+_PENDING_HINT_CODES: Final = {code.value: code for code in PendingHintCode}
+_FAILED_HINT_CODES: Final = {code.value: code for code in FailedHintCode}
+
+
+def _process_pending(
+    response_data: dict[str, Any], order_ref: OrderRef
+) -> PendingCollect:
+    hint_code = _PENDING_HINT_CODES.get(
+        response_data["hintCode"], PendingHintCode.UNKNOWN
+    )
+    return PendingCollect(order_ref=order_ref, hint_code=hint_code)
+
+
+def _process_complete(
+    response_data: dict[str, Any], order_ref: OrderRef
+) -> CompleteCollect:
+    completion_data = response_data["completionData"]
+    user = completion_data["user"]
+    device = completion_data["device"]
+    step_up = completion_data.get("stepUp")
+    return CompleteCollect(
+        order_ref=order_ref,
+        completion_data=CompletionData(
+            user=User(
+                personal_number=PersonalNumber(str(user["personalNumber"])),
+                name=str(user["name"]),
+                given_name=str(user["givenName"]),
+                surname=str(user["surname"]),
             ),
-        )
+            device=Device(ip_address=str(device["ipAddress"]), uhi=device.get("uhi")),
+            bankid_issue_date=completion_data["bankIdIssueDate"],
+            step_up=StepUp(mrtd=step_up["mrtd"]) if step_up is not None else None,
+            signature=completion_data["signature"],
+            ocsp_response=completion_data["ocspResponse"],
+        ),
+    )
+
+
+def _process_failed(
+    response_data: dict[str, Any], order_ref: OrderRef
+) -> FailedCollect:
+    hint_code = _FAILED_HINT_CODES.get(
+        response_data["hintCode"], FailedHintCode.UNKNOWN
+    )
+    return FailedCollect(order_ref=order_ref, hint_code=hint_code)
+
+
+# Keyed by str enum members, allowing lookup directly on a response's status string
+_STATUS_PROCESSORS: Final[
+    Mapping[str, Callable[[dict[str, Any], OrderRef], CollectResponse]]
+] = {
+    CollectStatus.PENDING: _process_pending,
+    CollectStatus.COMPLETE: _process_complete,
+    CollectStatus.FAILED: _process_failed,
+}
 
-    elif status is CollectStatus.FAILED:
-        try:
-            hint_code = FailedHintCode(response_data["hintCode"])
-        except ValueError:
-            hint_code = FailedHintCode.UNKNOWN
-        return FailedCollect(order_ref=order_ref, hint_code=hint_code)
 
-    assert_never(status)
+def process_collect_response(response: httpx.Response) -> CollectResponse:
+    response.raise_for_status()
+    response_data: dict[str, Any] = json.loads(response.content)
+    status = response_data["status"]
+    # Only strings are looked up, any other JSON value could be unhashable
+    processor = _STATUS_PROCESSORS.get(status) if isinstance(status, str) else None
+    if processor is None:
+        raise ValueError(f"Unknown collect status {status!r}")
+
+    return processor(response_data, OrderRef(response_data["orderRef"]))
 
 
 class TransactionExpired(Exception):
     ...
 
 
+_FINISHED_COLLECTS: Final = (CompleteCollect, FailedCollect)
+# Pending hint codes for which a QR code can still be used to start an order
+_QR_CODE_HINT_CODES: Final = frozenset(
+    {PendingHintCode.OUTSTANDING_TRANSACTION, PendingHintCode.NO_CLIENT}
+)
+
+
 def check(
     client: SyncV60, transaction_id: TransactionID, request: Any
 ) -> tuple[CollectResponse, str | None]:
@@ -155,13 +186,13 @@ def check(
         raise TransactionExpired
 
     result = client.collect(transaction.order_response.order_ref)
-    if isinstance(result, (CompleteCollect, FailedCollect)):
+    if isinstance(result, _FINISHED_COLLECTS):
         # Clear transaction from storage as soon as we encounter a finished BankID
         # collection. As we can't interact with its order any longer
         config.STORAGE.delete(transaction_id)
 
     if isinstance(result, CompleteCollect):
-        action = config.ACTIONS.get((transaction.operation, transaction.action_name))
+        action = config.ACTIONS[transaction.operation].get(transaction.action_name)
         if action is not None:
             action().finalize(result, request, transaction.context)
         else:
@@ -169,10 +200,7 @@ def check(
             ...
 
     qr_code = None
-    if isinstance(result, PendingCollect) and result.hint_code in {
-        PendingHintCode.OUTSTANDING_TRANSACTION,
-        PendingHintCode.NO_CLIENT,
-    }:
+    if isinstance(result, PendingCollect) and result.hint_code in _QR_CODE_HINT_CODES:
         qr_code = generate_qr_code(transaction.order_response)
 
     return result, qr_code
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from types import MappingProxyType
@@ -26,7 +27,6 @@ class ConfigurationError(Exception):
 
 
 T = TypeVar("T")
-_NOT_SET: Final = object()
 
 
 class LazyAttr(Generic[T]):
@@ -65,10 +65,12 @@ class LazyAttr(Generic[T]):
         if instance is None:
             return self
 
-        if getattr(self, "value", _NOT_SET) is _NOT_SET:
-            raise ConfigurationError(f"No value configured for {self.attrname}")
-
-        return self.value
+        try:
+            return self.value
+        except AttributeError:
+            raise ConfigurationError(
+                f"No value configured for {self.attrname}"
+            ) from None
 
     def __set__(self, instance: _Configuration, value: T) -> None:
         self.value = value
@@ -78,7 +80,10 @@ class LazyAttr(Generic[T]):
             del self.value
 
 
-ActionRegistry: TypeAlias = Mapping[tuple[Literal["auth", "sign"], str], type["Action"]]
+# Actions by operation and then by name, e.g. 'ACTIONS["auth"]["LOGIN"]'
+ActionRegistry: TypeAlias = Mapping[
+    Literal["auth", "sign"], Mapping[str, type["Action"]]
+]
 
 
 class _Configuration:
@@ -106,14 +111,17 @@ def configure(
     if storage is not None:
         config.STORAGE = storage
     if actions is not None:
+        registry: dict[Literal["auth", "sign"], dict[str, type[Action]]] = {
+            "auth": {},
+            "sign": {},
+        }
+        for action in actions:
+            operation: Literal["auth", "sign"] = (
+                "auth" if issubclass(action, AuthAction) else "sign"
+            )
+            registry[operation][sys.intern(action.name)] = action
         config.ACTIONS = MappingProxyType(
-            {
-                (
-                    "auth" if issubclass(action, AuthAction) else "sign",
-                    action.name,
-                ): action
-                for action in actions
-            }
+            {key: MappingProxyType(by_name) for key, by_name in registry.items()}
         )
     if certificate is not None:
         config.CERT = certificate
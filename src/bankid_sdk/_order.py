@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal, NamedTuple, Protocol, TypedDict
@@ -11,6 +13,7 @@ from typing_extensions import Self
 
 from ._requirement import Requirement
 from .typing import OrderRef
+from .utils import dataclass_slots
 
 
 class OrderRequest(NamedTuple):
@@ -20,7 +23,7 @@ class OrderRequest(NamedTuple):
     context: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class OrderResponse:
     order_ref: OrderRef
     auto_start_token: str
@@ -31,7 +34,7 @@ class OrderResponse:
 
 def process_order_response(response: httpx.Response) -> OrderResponse:
     response.raise_for_status()
-    response_data: dict[str, Any] = response.json()
+    response_data: dict[str, Any] = json.loads(response.content)
     return OrderResponse(
         order_ref=OrderRef(str(response_data["orderRef"])),
         auto_start_token=str(response_data["autoStartToken"]),
@@ -52,7 +55,7 @@ class SerializedTransaction(TypedDict):
     context: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **dataclass_slots)
 class Transaction:
     order_response: OrderResponse
     operation: Literal["auth", "sign"]
@@ -61,30 +64,35 @@ class Transaction:
 
     @classmethod
     def from_dict(cls, obj: dict[str, Any], /) -> Self:
+        """
+        Restores a transaction from the output of 'as_dict'. Values are trusted to be
+        of the serialized types and are not converted again.
+        """
         return cls(
             order_response=OrderResponse(
-                order_ref=OrderRef(str(obj["order_ref"])),
-                auto_start_token=str(obj["auto_start_token"]),
-                qr_start_token=str(obj["qr_start_token"]),
-                qr_start_secret=str(obj["qr_start_secret"]),
+                order_ref=obj["order_ref"],
+                auto_start_token=obj["auto_start_token"],
+                qr_start_token=obj["qr_start_token"],
+                qr_start_secret=obj["qr_start_secret"],
                 start_time=datetime.fromisoformat(obj["start_time"]),
             ),
-            operation=str(obj["operation"]),  # type: ignore[arg-type]
-            action_name=str(obj["action_name"]),
+            operation=obj["operation"],
+            action_name=obj["action_name"],
             context=obj["context"],
         )
 
     def as_dict(self) -> SerializedTransaction:
-        return SerializedTransaction(
-            order_ref=self.order_response.order_ref,
-            auto_start_token=self.order_response.auto_start_token,
-            qr_start_token=self.order_response.qr_start_token,
-            qr_start_secret=self.order_response.qr_start_secret,
-            start_time=self.order_response.start_time.isoformat(),
-            operation=self.operation,
-            action_name=self.action_name,
-            context=self.context,
-        )
+        order_response = self.order_response
+        return {
+            "order_ref": order_response.order_ref,
+            "auto_start_token": order_response.auto_start_token,
+            "qr_start_token": order_response.qr_start_token,
+            "qr_start_secret": order_response.qr_start_secret,
+            "start_time": order_response.start_time.isoformat(),
+            "operation": self.operation,
+            "action_name": self.action_name,
+            "context": self.context,
+        }
 
 
 class _Order(Protocol):
@@ -102,16 +110,9 @@ class _Order(Protocol):
 
 
 def generate_qr_code(order: _Order) -> str:
-    qr_time = str(
-        int(datetime.now(tz=timezone.utc).timestamp() - order.start_time.timestamp())
-    )
-    return ".".join(
-        [
-            "bankid",
-            order.qr_start_token,
-            qr_time,
-            hmac.new(
-                order.qr_start_secret.encode(), qr_time.encode(), hashlib.sha256
-            ).hexdigest(),
-        ]
-    )
+    # Seconds since the order started, a UNIX timestamp is the same in any timezone
+    qr_time = str(int(time.time() - order.start_time.timestamp()))
+    qr_auth_code = hmac.new(
+        order.qr_start_secret.encode(), qr_time.encode(), hashlib.sha256
+    ).hexdigest()
+    return ".".join(["bankid", order.qr_start_token, qr_time, qr_auth_code])
@@ -7,26 +7,25 @@ from typing import (
 )
 
 from .typing import PersonalNumber
+from .utils import dataclass_slots
 
 
-def validate_personal_number(value: str | None, /) -> PersonalNumber | None:
+def validate_personal_number(value: str, /) -> PersonalNumber:
     """
     Naive validation of a (swedish) personal number format
     """
-    if value is None:
-        return None
-
     # TODO: Support length 10 also?
     personal_number_length = 12
     if len(value) != personal_number_length:
         raise ValueError("Personal number not of length 12")
-    if not value.isdigit():
+    # 'isdigit' alone would also accept non ASCII digits, e.g. Arabic-Indic ones
+    if not (value.isascii() and value.isdigit()):
         raise ValueError("Personal number includes non digits")
 
     return PersonalNumber(value)
 
 
-@dataclass()
+@dataclass(**dataclass_slots)
 class Requirement:
     pin_code: Literal[True] | None = None
     mrtd: Literal[True] | None = None
@@ -38,15 +37,20 @@ class Requirement:
 def _build_requirement_data(
     _requirement: Requirement | None, /
 ) -> dict[str, Any] | None:
-    requirement = {}
-    if _requirement is not None:
-        for req_key, req in [
-            ("pinCode", _requirement.pin_code),
-            ("mrtd", _requirement.mrtd),
-            ("cardReader", _requirement.card_reader),
-            ("certificatePolicies", _requirement.certificate_policies),
-            ("personalNumber", validate_personal_number(_requirement.personal_number)),
-        ]:
-            if req is not None:
-                requirement[req_key] = req
+    if _requirement is None:
+        return None
+
+    requirement: dict[str, Any] = {}
+    if _requirement.pin_code is not None:
+        requirement["pinCode"] = _requirement.pin_code
+    if _requirement.mrtd is not None:
+        requirement["mrtd"] = _requirement.mrtd
+    if _requirement.card_reader is not None:
+        requirement["cardReader"] = _requirement.card_reader
+    if _requirement.certificate_policies is not None:
+        requirement["certificatePolicies"] = _requirement.certificate_policies
+    if _requirement.personal_number is not None:
+        requirement["personalNumber"] = validate_personal_number(
+            _requirement.personal_number
+        )
     return requirement or None
@@ -9,6 +9,7 @@ from typing import (
 
 from ._requirement import Requirement, _build_requirement_data
 from .typing import Base64
+from .utils import base64_length
 
 
 def _encode_user_data(
@@ -18,12 +19,12 @@ def _encode_user_data(
         if not value:
             return None
 
-        encoded = b64encode(value.encode())
-        length = len(encoded)
+        raw = value.encode()
+        length = base64_length(len(raw))
         if length > max_length:
             raise ValueError(f"User {purpose} data too large ({length})")
 
-        return Base64(encoded.decode())
+        return Base64(b64encode(raw).decode("ascii"))
 
     return validator
 
@@ -39,15 +40,13 @@ def build_sign_request(
         "endUserIp": end_user_ip,
         "userVisibleData": _encode_user_data(40_000, "visible")(user_visible_data),
     }
-    for key, option in [
+    options = (
         ("requirement", _build_requirement_data(requirement)),
         (
             "userNonVisibleData",
             _encode_user_data(200_000, "non visible")(user_non_visible_data),
         ),
         ("userVisibleDataFormat", user_visible_data_format),
-    ]:
-        if option is not None:
-            data[key] = option
-
+    )
+    data.update((key, option) for key, option in options if option is not None)
     return data
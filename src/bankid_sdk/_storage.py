@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import secrets
 from contextlib import suppress
-from typing import Final, Protocol
-from uuid import uuid4
+from typing import Protocol, runtime_checkable
 
 from ._order import Transaction
 from .typing import TransactionID
@@ -19,24 +20,62 @@ class Storage(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncStorage(Protocol):
+    async def asave(self, obj: Transaction, /) -> TransactionID:
+        ...
+
+    async def aload(self, key: TransactionID, /) -> Transaction | None:
+        ...
+
+    async def adelete(self, key: TransactionID, /) -> None:
+        ...
+
+
+async def aload(storage: Storage, key: TransactionID, /) -> Transaction | None:
+    """
+    Loads from storage without blocking the event loop, falling back to running a
+    sync only storage in a worker thread.
+    """
+    if isinstance(storage, AsyncStorage):
+        return await storage.aload(key)
+    return await asyncio.to_thread(storage.load, key)
+
+
+async def adelete(storage: Storage, key: TransactionID, /) -> None:
+    """
+    Deletes from storage without blocking the event loop, falling back to running a
+    sync only storage in a worker thread.
+    """
+    if isinstance(storage, AsyncStorage):
+        await storage.adelete(key)
+    else:
+        await asyncio.to_thread(storage.delete, key)
+
+
 class MemoryStorage:
     __slots__ = ("content",)
-    NO_VALUE: Final = object()
 
     def __init__(self) -> None:
         self.content = dict[TransactionID, Transaction]()
 
     def save(self, obj: Transaction, /) -> TransactionID:
-        transaction_id = TransactionID(str(uuid4()))
+        transaction_id = TransactionID(secrets.token_hex(16))
         self.content[transaction_id] = obj
         return transaction_id
 
     def load(self, key: TransactionID, /) -> Transaction | None:
-        obj = self.content.get(key, self.NO_VALUE)
-        if obj is not self.NO_VALUE:
-            return obj  # type: ignore[return-value]
-        return None
+        return self.content.get(key)
 
     def delete(self, key: TransactionID, /) -> None:
         with suppress(KeyError):
             del self.content[key]
+
+    async def asave(self, obj: Transaction, /) -> TransactionID:
+        return self.save(obj)
+
+    async def aload(self, key: TransactionID, /) -> Transaction | None:
+        return self.load(key)
+
+    async def adelete(self, key: TransactionID, /) -> None:
+        self.delete(key)
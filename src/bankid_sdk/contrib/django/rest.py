@@ -1,103 +1,196 @@
 from __future__ import annotations
 
+import atexit
+import json
+import threading
 from collections.abc import Callable
 from functools import wraps
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Final
 
 import httpx
 from django.conf import settings as django_settings
 from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.views.decorators.cache import never_cache
-from django.views.decorators.csrf import csrf_exempt
+from django.utils.cache import add_never_cache_headers
 from typing_extensions import TypeAlias
 
 import bankid_sdk
 from bankid_sdk.utils import logger
 
-from .request import get_client_ip, parse_json_body, require_POST
+from .request import (
+    get_client_ip,
+    json_content_response,
+    read_json_body,
+    reject_non_post,
+)
 from .transaction import envelop, mask_last_four, verify_envelope
 
 View: TypeAlias = Callable[[HttpRequest], HttpResponse]
 APIView: TypeAlias = Callable[[HttpRequest, dict[str, Any]], HttpResponse]
 
 
+class _SharedClient:
+    __slots__ = ("client", "settings", "lock")
+
+    def __init__(self) -> None:
+        self.client: httpx.Client | None = None
+        # Configured values the client was created from
+        self.settings: tuple[Any, ...] = ()
+        self.lock = threading.Lock()
+
+
+_shared: Final = _SharedClient()
+
+
+def get_client() -> httpx.Client:
+    """
+    Returns a HTTP client shared between requests, created from configured values
+    on first use. Reusing it keeps connections, and their TLS sessions, alive across
+    requests instead of doing a new handshake for each call to BankID.
+
+    The client is replaced when 'bankid_sdk.configure' has changed the API base URL
+    or any of the certificates since it was created.
+    """
+    config = bankid_sdk.config
+    settings = (config.API_BASE_URL, config.CERT, config.CA_CERT)
+    with _shared.lock:
+        if _shared.client is None or _shared.settings != settings:
+            # A replaced client isn't closed here, other threads might still be in
+            # the middle of a call with it. Its connections are released once it's
+            # garbage collected.
+            _shared.client = bankid_sdk.SyncV60.default_client()
+            _shared.settings = settings
+        return _shared.client
+
+
+@atexit.register
+def close_client() -> None:
+    """
+    Closes the shared HTTP client, if any. A new client is created on next use.
+    """
+    with _shared.lock:
+        client, _shared.client = _shared.client, None
+    if client is not None:
+        client.close()
+
+
+def validation_error_content(loc: str, msg: str, error_type: str) -> bytes:
+    return json.dumps(
+        {"detail": [{"loc": [loc], "msg": msg, "type": error_type}]}
+    ).encode()
+
+
+SERVICE_UNAVAILABLE_CONTENT: Final = json.dumps(
+    {"detail": "Service unavailable"}
+).encode()
+INVALID_IP_CONTENT: Final = json.dumps({"detail": "Invalid IP"}).encode()
+INVALID_ACTION_CONTENT: Final = validation_error_content(
+    "action", "invalid value", "value_error"
+)
+MISSING_ACTION_CONTENT: Final = validation_error_content(
+    "action", "field required", "value_error.missing"
+)
+INVALID_TRANSACTION_ID_CONTENT: Final = validation_error_content(
+    "transaction_id", "invalid value", "value_error"
+)
+MISSING_TRANSACTION_ID_CONTENT: Final = validation_error_content(
+    "transaction_id", "field required", "value_error.missing"
+)
+EXPIRED_TRANSACTION_ID_CONTENT: Final = validation_error_content(
+    "transaction_id", "transaction expired", "value_error.expired"
+)
+
+
+def service_unavailable(
+    exc: bankid_sdk.BankIDAPIError | bankid_sdk.BankIDHTTPError, /
+) -> HttpResponse:
+    if isinstance(exc, bankid_sdk.BankIDAPIError):
+        logger.error("apierror http_status=%d error_code=%s", exc.code, exc.error_code)
+    else:
+        logger.warning("httperror")
+
+    retry_after = getattr(django_settings, "BANKID_SDK_DEFAULT_RETRY_AFTER", 1)
+    assert retry_after >= 0
+    return json_content_response(
+        SERVICE_UNAVAILABLE_CONTENT,
+        status=HTTPStatus.SERVICE_UNAVAILABLE,
+        headers={"Retry-After": retry_after},
+    )
+
+
 def exception_handler(view: View) -> View:
     @wraps(view)
     def inner(request: HttpRequest) -> HttpResponse:
         try:
             return view(request)
         except (bankid_sdk.BankIDAPIError, bankid_sdk.BankIDHTTPError) as exc:
-            if isinstance(exc, bankid_sdk.BankIDAPIError):
-                logger.error(
-                    "apierror http_status=%d error_code=%s", exc.code, exc.error_code
-                )
-            else:
-                logger.warning("httperror")
-
-            retry_after = getattr(django_settings, "BANKID_SDK_DEFAULT_RETRY_AFTER", 1)
-            assert retry_after >= 0
-            return JsonResponse(
-                {"detail": "Service unavailable"},
-                status=HTTPStatus.SERVICE_UNAVAILABLE,
-                headers={"Retry-After": retry_after},
-            )
+            return service_unavailable(exc)
 
     return inner
 
 
 def api_view(view: APIView) -> View:
-    return require_POST(
-        never_cache(csrf_exempt(exception_handler(parse_json_body(view))))
-    )
+    """
+    Turns a view into a POST only JSON API endpoint. Which is never cached, exempt
+    from CSRF checks and responds with service unavailable on BankID errors.
+
+    Does the work of 'require_POST', 'never_cache', 'csrf_exempt' and
+    'parse_json_body' within a single wrapper, as it runs for every API call.
+    """
+
+    @wraps(view)
+    def inner(request: HttpRequest) -> HttpResponse:
+        response = reject_non_post(request)
+        if response is not None:
+            return response
+
+        data = read_json_body(request)
+        if isinstance(data, HttpResponse):
+            response = data
+        else:
+            try:
+                response = view(request, data)
+            except (bankid_sdk.BankIDAPIError, bankid_sdk.BankIDHTTPError) as exc:
+                response = service_unavailable(exc)
+
+        add_never_cache_headers(response)
+        return response
+
+    inner.csrf_exempt = True  # type: ignore[attr-defined]
+    return inner
 
 
 @api_view
-def auth(request: HttpRequest, data: dict[str, Any]) -> JsonResponse:
+def auth(request: HttpRequest, data: dict[str, Any]) -> HttpResponse:
     action_name = str(data.get("action", ""))
-    action = bankid_sdk.config.ACTIONS.get(("auth", action_name))
+    action = bankid_sdk.config.ACTIONS["auth"].get(action_name)
     if action is None or not issubclass(action, bankid_sdk.AuthAction):
-        detail = (
-            {"loc": ["action"], "msg": "invalid value", "type": "value_error"}
-            if "action" in data
-            else {
-                "loc": ["action"],
-                "msg": "field required",
-                "type": "value_error.missing",
-            }
-        )
-        return JsonResponse(
-            {"detail": [detail]}, status=HTTPStatus.UNPROCESSABLE_ENTITY
+        return json_content_response(
+            INVALID_ACTION_CONTENT if "action" in data else MISSING_ACTION_CONTENT,
+            status=HTTPStatus.UNPROCESSABLE_ENTITY,
         )
 
     client_ip = get_client_ip(request)
     if client_ip is None:
         logger.warning("request missing ip")
-        return JsonResponse({"detail": "Invalid IP"}, status=HTTPStatus.BAD_REQUEST)
+        return json_content_response(INVALID_IP_CONTENT, status=HTTPStatus.BAD_REQUEST)
 
-    with httpx.Client(
-        base_url=bankid_sdk.config.API_BASE_URL,
-        cert=bankid_sdk.config.CERT,
-        verify=bankid_sdk.config.CA_CERT,
-    ) as client:
-        try:
-            order = bankid_sdk.init_auth(
-                client=bankid_sdk.SyncV60(client=client),
-                action=action,
-                order_request=bankid_sdk.OrderRequest(
-                    end_user_ip=str(client_ip),
-                    requirement=None,
-                    request=request,
-                    context=data.get("context"),
-                ),
-            )
-        except bankid_sdk.InitFailed as exc:
-            return JsonResponse(
-                {"detail": exc.detail},
-                status=(
-                    exc.status if exc.status is not None else HTTPStatus.BAD_REQUEST
-                ),
-            )
+    try:
+        order = bankid_sdk.init_auth(
+            client=bankid_sdk.SyncV60(client=get_client()),
+            action=action,
+            order_request=bankid_sdk.OrderRequest(
+                end_user_ip=str(client_ip),
+                requirement=None,
+                request=request,
+                context=data.get("context"),
+            ),
+        )
+    except bankid_sdk.InitFailed as exc:
+        return JsonResponse(
+            {"detail": exc.detail},
+            status=exc.status if exc.status is not None else HTTPStatus.BAD_REQUEST,
+        )
 
     return JsonResponse(
         {
@@ -114,37 +207,20 @@ def validate_transaction_id(
     def inner(request: HttpRequest, data: dict[str, Any], /) -> HttpResponse:
         transaction_id = verify_envelope(str(data.get("transaction_id") or ""))
         if transaction_id is None:
-            detail = (
-                {
-                    "loc": ["transaction_id"],
-                    "msg": "invalid value",
-                    "type": "value_error",
-                }
-                if "transaction_id" in data
-                else {
-                    "loc": ["transaction_id"],
-                    "msg": "field required",
-                    "type": "value_error.missing",
-                }
-            )
-            return JsonResponse(
-                {"detail": [detail]}, status=HTTPStatus.UNPROCESSABLE_ENTITY
+            return json_content_response(
+                (
+                    INVALID_TRANSACTION_ID_CONTENT
+                    if "transaction_id" in data
+                    else MISSING_TRANSACTION_ID_CONTENT
+                ),
+                status=HTTPStatus.UNPROCESSABLE_ENTITY,
             )
 
         try:
             return view(request, transaction_id)
         except bankid_sdk.TransactionExpired:
-            return JsonResponse(
-                {
-                    "detail": [
-                        {
-                            "loc": ["transaction_id"],
-                            "msg": "transaction expired",
-                            "type": "value_error.expired",
-                        }
-                    ]
-                },
-                status=HTTPStatus.UNPROCESSABLE_ENTITY,
+            return json_content_response(
+                EXPIRED_TRANSACTION_ID_CONTENT, status=HTTPStatus.UNPROCESSABLE_ENTITY
             )
 
     return inner
@@ -155,22 +231,15 @@ def validate_transaction_id(
 def check(
     request: HttpRequest, transaction_id: bankid_sdk.TransactionID
 ) -> JsonResponse:
-    with httpx.Client(
-        base_url=bankid_sdk.config.API_BASE_URL,
-        cert=bankid_sdk.config.CERT,
-        verify=bankid_sdk.config.CA_CERT,
-    ) as client:
-        try:
-            result, qr_code = bankid_sdk.check(
-                bankid_sdk.SyncV60(client=client), transaction_id, request
-            )
-        except bankid_sdk.FinalizeFailed as exc:
-            return JsonResponse(
-                {"detail": exc.detail},
-                status=(
-                    exc.status if exc.status is not None else HTTPStatus.BAD_REQUEST
-                ),
-            )
+    try:
+        result, qr_code = bankid_sdk.check(
+            bankid_sdk.SyncV60(client=get_client()), transaction_id, request
+        )
+    except bankid_sdk.FinalizeFailed as exc:
+        return JsonResponse(
+            {"detail": exc.detail},
+            status=exc.status if exc.status is not None else HTTPStatus.BAD_REQUEST,
+        )
 
     response_data: dict[str, Any]
     if isinstance(result, bankid_sdk.PendingCollect):
@@ -187,17 +256,16 @@ def check(
         }
     else:
         assert isinstance(result, bankid_sdk.CompleteCollect)
+        user = result.completion_data.user
         response_data = {
             "status": "complete",
             "order": {
                 # TODO: "visible_data": result.completion_data.user_visible_data,
                 "user": {
-                    "name": result.completion_data.user.name,
-                    "given_name": result.completion_data.user.given_name,
-                    "surname": result.completion_data.user.surname,
-                    "personal_number": mask_last_four(
-                        result.completion_data.user.personal_number
-                    ),
+                    "name": user.name,
+                    "given_name": user.given_name,
+                    "surname": user.surname,
+                    "personal_number": mask_last_four(user.personal_number),
                 },
             },
         }
@@ -210,11 +278,6 @@ def check(
 def cancel(
     request: HttpRequest, transaction_id: bankid_sdk.TransactionID
 ) -> HttpResponse:
-    with httpx.Client(
-        base_url=bankid_sdk.config.API_BASE_URL,
-        cert=bankid_sdk.config.CERT,
-        verify=bankid_sdk.config.CA_CERT,
-    ) as client:
-        bankid_sdk.cancel(bankid_sdk.SyncV60(client=client), transaction_id)
+    bankid_sdk.cancel(bankid_sdk.SyncV60(client=get_client()), transaction_id)
 
     return HttpResponse(status=HTTPStatus.NO_CONTENT, content_type="application/json")
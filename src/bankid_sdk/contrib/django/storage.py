@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-from uuid import uuid4
+import secrets
+from typing import Final
 
 from django.core.cache import cache
 
 import bankid_sdk
 
+# Kept in cache for 15min
+TRANSACTION_TIMEOUT: Final = 60 * 15
+
 
 class CacheStorage:
     __slots__ = ()
 
     def save(self, obj: bankid_sdk.Transaction, /) -> bankid_sdk.TransactionID:
-        transaction_id = bankid_sdk.TransactionID(str(uuid4()))
-        # Kept in cache for 15min
-        cache.set(key=transaction_id, value=obj.as_dict(), timeout=60 * 15)
+        transaction_id = bankid_sdk.TransactionID(secrets.token_hex(16))
+        cache.set(key=transaction_id, value=obj.as_dict(), timeout=TRANSACTION_TIMEOUT)
         return transaction_id
 
     def load(self, key: bankid_sdk.TransactionID, /) -> bankid_sdk.Transaction | None:
@@ -24,3 +27,21 @@ class CacheStorage:
 
     def delete(self, key: bankid_sdk.TransactionID, /) -> None:
         cache.delete(key)
+
+    async def asave(self, obj: bankid_sdk.Transaction, /) -> bankid_sdk.TransactionID:
+        transaction_id = bankid_sdk.TransactionID(secrets.token_hex(16))
+        await cache.aset(
+            key=transaction_id, value=obj.as_dict(), timeout=TRANSACTION_TIMEOUT
+        )
+        return transaction_id
+
+    async def aload(
+        self, key: bankid_sdk.TransactionID, /
+    ) -> bankid_sdk.Transaction | None:
+        obj = await cache.aget(key)
+        if obj is not None:
+            return bankid_sdk.Transaction.from_dict(obj)
+        return None
+
+    async def adelete(self, key: bankid_sdk.TransactionID, /) -> None:
+        await cache.adelete(key)
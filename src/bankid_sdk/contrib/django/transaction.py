@@ -1,26 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 from contextlib import suppress
 from datetime import timedelta
+from functools import lru_cache
 from typing import Final
 
 from django.core import signing
+from django.utils.encoding import force_bytes
 
 import bankid_sdk
 
-_transaction_signer: Final = signing.TimestampSigner(
+
+@lru_cache(maxsize=8)
+def _keyed_hmac(key_salt: bytes, secret: bytes, algorithm: str) -> hmac.HMAC:
+    # Same key derivation as 'django.utils.crypto.salted_hmac'
+    hasher = getattr(hashlib, algorithm)
+    return hmac.new(hasher(key_salt + secret).digest(), digestmod=hasher)
+
+
+class _TransactionSigner(signing.TimestampSigner):
+    """
+    Produces the same signatures as Django's 'TimestampSigner', while deriving and
+    setting up the HMAC key once per secret instead of on every sign/unsign.
+    """
+
+    def signature(self, value: str | bytes, key: str | bytes | None = None) -> str:
+        mac = _keyed_hmac(
+            force_bytes(self.salt) + b"signer",
+            force_bytes(key or self.key),
+            self.algorithm,
+        ).copy()
+        mac.update(force_bytes(value))
+        return signing.b64_encode(mac.digest()).decode()
+
+
+_transaction_signer: Final = _TransactionSigner(
     salt="bankid_sdk.contrib.django.transaction"
 )
 
 
 def envelop(value: bankid_sdk.TransactionID, /) -> str:
-    return _transaction_signer.sign_object(value)
+    # Transaction ids are plain strings, no need to serialize them as objects
+    return _transaction_signer.sign(value)
 
 
 def verify_envelope(value: str, /) -> bankid_sdk.TransactionID | None:
     with suppress(signing.BadSignature):
         return bankid_sdk.TransactionID(
-            _transaction_signer.unsign_object(value, max_age=timedelta(minutes=5))
+            _transaction_signer.unsign(value, max_age=timedelta(minutes=5))
         )
     return None
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
 from contextlib import contextmanager
 from http import HTTPStatus
@@ -87,29 +88,35 @@ error_map: Final = MappingProxyType[tuple[int, str], type[BankIDAPIError]](
 )
 
 
-@contextmanager
-def httpx_error_hook() -> Generator[None, None, None]:
+def translate_httpx_error(exc: httpx.HTTPError, /) -> Exception:
     """
-    An exception hook that converts;
+    Converts;
 
     - Any httpx http status error to a BankIDAPIError
     - Any httpx http error to a BankIDHTTPError
     """
-    try:
-        yield
-    except httpx.HTTPStatusError as exc:
+    if isinstance(exc, httpx.HTTPStatusError):
         try:
-            data = exc.response.json()
+            data = json.loads(exc.response.content)
         except ValueError:
-            raise UnknownError(
-                response=exc.response, error_code="unknownError"
-            ) from exc
+            return UnknownError(response=exc.response, error_code="unknownError")
 
         error_code = data.get("errorCode")
         Error = error_map.get((exc.response.status_code, error_code), UnknownError)
-        error = Error(
+        return Error(
             response=exc.response, error_code=error_code or "unknownError", json=data
         )
-        raise error from exc
+
+    return BankIDHTTPError()
+
+
+@contextmanager
+def httpx_error_hook() -> Generator[None, None, None]:
+    """
+    An exception hook that translates any httpx http error via
+    'translate_httpx_error'.
+    """
+    try:
+        yield
     except httpx.HTTPError as exc:
-        raise BankIDHTTPError from exc
+        raise translate_httpx_error(exc) from exc
@@ -1,11 +1,6 @@
-from typing import NewType, final
-
-
-@final
-class TransactionID(str):
-    __slots__ = ()
-
+from typing import NewType
 
+TransactionID = NewType("TransactionID", str)
 OrderRef = NewType("OrderRef", str)
 Base64 = NewType("Base64", str)
 PersonalNumber = NewType("PersonalNumber", str)
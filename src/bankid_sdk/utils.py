@@ -1,3 +1,19 @@
 import logging
+import sys
+from typing import Any, Final
 
 logger = logging.getLogger("bankid_sdk")
+
+# Keyword arguments to 'dataclass' for dropping per instance '__dict__', the 'slots'
+# argument is only available from Python 3.10.
+dataclass_slots: Final[dict[str, Any]] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+def base64_length(size: int, /) -> int:
+    """
+    Length of the base64 encoding of 'size' bytes, allowing oversized data to be
+    rejected before doing any encoding.
+    """
+    return 4 * -(-size // 3)
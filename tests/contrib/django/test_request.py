@@ -3,13 +3,22 @@ from http import HTTPStatus
 from unittest import mock
 
 import pytest
-from django.http import JsonResponse, RawPostDataException
+from django.http import HttpResponse, RawPostDataException
 from django.test.client import RequestFactory
 
-from bankid_sdk.contrib.django.request import get_client_ip, parse_json_body
+from bankid_sdk.contrib.django.request import (
+    get_client_ip,
+    load_stream,
+    parse_json_body,
+    require_POST,
+)
 
 
 class TestParseJSONBody:
+    @pytest.fixture()
+    def view(self) -> mock.Mock:
+        return mock.Mock(return_value=HttpResponse())
+
     @pytest.mark.parametrize(
         "data",
         [
@@ -18,9 +27,10 @@ class TestParseJSONBody:
             pytest.param('{"value": -Infinity}', id="-Infinity"),
         ],
     )
-    def test_returns_bad_request_when_receiving(self, data: str) -> None:
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory().post("/", data=data, content_type="application/json")
+    def test_returns_bad_request_when_receiving(
+        self, rf: RequestFactory, view: mock.Mock, data: str
+    ) -> None:
+        request = rf.post("/", data=data, content_type="application/json")
         response = parse_json_body(view)(request)
         assert response.status_code == HTTPStatus.BAD_REQUEST
         assert response.headers.get("Content-Type") == "application/json"
@@ -28,50 +38,68 @@ class TestParseJSONBody:
 
         view.assert_not_called()
 
-    def test_returns_raises_error_if_body_is_read_twice(self) -> None:
+    def test_returns_raises_error_if_body_is_read_twice(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
         # Ensure we don't accidentally read twice by confirming that a
         # RawPostDataException propagates
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory().post("/", data="{}", content_type="application/json")
+        request = rf.post("/", data="{}", content_type="application/json")
         request.read()
         with pytest.raises(RawPostDataException):
             parse_json_body(view)(request)
 
         view.assert_not_called()
 
-    def test_passes_through_empty_body_when_content_length_is_missing(self) -> None:
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory(CONTENT_TYPE="application/json").generic("POST", "/")
+    def test_passes_through_empty_body_when_content_length_is_missing(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        request = rf.generic("POST", "/", CONTENT_TYPE="application/json")
         response = parse_json_body(view)(request)
         assert response.status_code == HTTPStatus.OK
 
         view.assert_called_once_with(request, {})
 
-    def test_passes_through_empty_body_when_content_length_is_zero(self) -> None:
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory(
-            CONTENT_TYPE="application/json", CONTENT_LENGTH="0"
-        ).generic("POST", "/")
+    def test_passes_through_empty_body_when_content_length_is_zero(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        request = rf.generic(
+            "POST", "/", CONTENT_TYPE="application/json", CONTENT_LENGTH="0"
+        )
         response = parse_json_body(view)(request)
         assert response.status_code == HTTPStatus.OK
 
         view.assert_called_once_with(request, {})
 
     def test_passes_through_empty_body_when_content_length_is_invalid_value(
-        self,
+        self, rf: RequestFactory, view: mock.Mock
     ) -> None:
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory(
-            CONTENT_TYPE="application/json", CONTENT_LENGTH="abc"
-        ).generic("POST", "/")
+        request = rf.generic(
+            "POST", "/", CONTENT_TYPE="application/json", CONTENT_LENGTH="abc"
+        )
         response = parse_json_body(view)(request)
         assert response.status_code == HTTPStatus.OK
 
         view.assert_called_once_with(request, {})
 
-    def test_returns_unsupported_media_type_on_non_json_contents(self) -> None:
-        view = mock.MagicMock(return_value=JsonResponse({}))
-        request = RequestFactory().post("/", data="abc", content_type="text/plain")
+    def test_parses_body_when_content_length_is_padded(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        request = rf.generic(
+            "POST",
+            "/",
+            data='{"a": 1}',
+            CONTENT_TYPE="application/json",
+            CONTENT_LENGTH=" 8",
+        )
+        response = parse_json_body(view)(request)
+        assert response.status_code == HTTPStatus.OK
+
+        view.assert_called_once_with(request, {"a": 1})
+
+    def test_returns_unsupported_media_type_on_non_json_contents(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        request = rf.post("/", data="abc", content_type="text/plain")
         response = parse_json_body(view)(request)
         assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
         assert response.headers.get("Content-Type") == "application/json"
@@ -83,6 +111,36 @@ class TestParseJSONBody:
 
 
 class TestGetClientIP:
-    def test_returns_none_if_remote_addr_is_none(self) -> None:
-        request = RequestFactory().get("/", REMOTE_ADDR=None)
+    def test_returns_none_if_remote_addr_is_none(self, rf: RequestFactory) -> None:
+        request = rf.get("/", REMOTE_ADDR=None)
         assert get_client_ip(request) is None
+
+
+class TestRequirePOST:
+    @pytest.fixture()
+    def view(self) -> mock.Mock:
+        return mock.Mock(return_value=HttpResponse())
+
+    def test_passes_through_post_request(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        request = rf.post("/")
+        response = require_POST(view)(request)
+        assert response.status_code == HTTPStatus.OK
+
+        view.assert_called_once_with(request)
+
+    def test_returns_method_not_allowed_on_get(
+        self, rf: RequestFactory, view: mock.Mock
+    ) -> None:
+        response = require_POST(view)(rf.get("/"))
+        assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+        assert response.headers.get("Allow") == "POST"
+        assert json.loads(response.content) == {"detail": "Method 'GET' not allowed"}
+
+        view.assert_not_called()
+
+
+def test_load_stream_reads_request_body(rf: RequestFactory) -> None:
+    request = rf.post("/", data=b"{}", content_type="application/json")
+    assert load_stream(request).read() == b"{}"
@@ -14,17 +14,28 @@ from typing import Any
 import httpx
 import pytest
 import respx
-from dirty_equals import IsPartialDict, IsStr, IsUUID
+from dirty_equals import IsPartialDict, IsStr
 from django.core.signing import TimestampSigner
+from django.http import HttpResponse
 from django.test import override_settings
-from django.test.client import Client
-from django.urls import reverse, reverse_lazy
+from django.test.client import Client, RequestFactory
+from django.urls import reverse
 from freezegun import freeze_time
 
 import bankid_sdk
+from bankid_sdk.contrib.django.rest import (
+    close_client,
+    exception_handler,
+    get_client,
+)
 from bankid_sdk.contrib.django.storage import CacheStorage
 from tests.mocks import bankid_mock
 
+transaction_signer = TimestampSigner(salt="bankid_sdk.contrib.django.transaction")
+# User data sent to BankID by 'DjangoLoginAction'
+LOGIN_VISIBLE_DATA = b64encode(b"dummy_login_action_visible_auth_data").decode()
+LOGIN_NON_VISIBLE_DATA = b64encode(b"dummy_login_action_non_visible_auth_data").decode()
+
 
 class DjangoLoginAction(bankid_sdk.AuthAction):
     name = "LOGIN"
@@ -95,7 +106,7 @@ class FailsFinalizeAction(bankid_sdk.AuthAction):
 
 
 @pytest.fixture()
-def _configure_bankid_sdk(fixtures_dir: Path) -> None:
+def _configure_bankid_sdk(fixtures_dir: Path) -> Generator[None, None, None]:
     bankid_sdk.configure(
         api_base_url="https://example.com",
         storage=CacheStorage(),
@@ -111,18 +122,62 @@ def _configure_bankid_sdk(fixtures_dir: Path) -> None:
         ),
         ca_cert=str(fixtures_dir / "fake_cacert.crt"),
     )
+    yield
+    close_client()
 
 
 pytestmark = pytest.mark.usefixtures("mock_bankid", "_configure_bankid_sdk")
 
 
+def test_shares_http_client_between_requests() -> None:
+    client = get_client()
+    assert get_client() is client
+    close_client()
+    assert client.is_closed
+    assert get_client() is not client
+
+
+def test_replaces_http_client_when_configuration_changes() -> None:
+    client = get_client()
+    bankid_sdk.configure(api_base_url="https://example.org/")
+    replacement = get_client()
+    assert replacement is not client
+    # Requests in flight on the replaced client are left to finish
+    assert not client.is_closed
+    client.close()
+    assert replacement.base_url == "https://example.org/"
+
+
+def test_exception_handler_responds_service_unavailable_on_bankid_error(
+    rf: RequestFactory,
+) -> None:
+    @exception_handler
+    def view(request: Any) -> Any:
+        raise bankid_sdk.BankIDHTTPError
+
+    response = view(rf.post("/"))
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers.get("Retry-After") == "1"
+    assert json.loads(response.content) == {"detail": "Service unavailable"}
+
+
+def test_exception_handler_passes_through_response(rf: RequestFactory) -> None:
+    response = exception_handler(lambda request: HttpResponse())(rf.post("/"))
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_closing_http_client_when_not_created_is_noop() -> None:
+    close_client()
+    close_client()
+
+
 endpoints = pytest.mark.parametrize(
     "url",
     [
-        pytest.param(reverse_lazy("auth"), id="auth"),
-        # TODO: pytest.param(reverse_lazy("sign"), id="sign"),
-        pytest.param(reverse_lazy("check"), id="check"),
-        pytest.param(reverse_lazy("cancel"), id="cancel"),
+        pytest.param(reverse("auth"), id="auth"),
+        # TODO: pytest.param(reverse("sign"), id="sign"),
+        pytest.param(reverse("check"), id="check"),
+        pytest.param(reverse("cancel"), id="cancel"),
     ],
 )
 
@@ -151,6 +206,15 @@ def test_tells_to_never_cache_on(client: Client, url: str) -> None:
     assert cache_control == "max-age=0, no-cache, no-store, must-revalidate, private"
 
 
+@endpoints
+def test_returns_bad_request_for_malformed_body_on(client: Client, url: str) -> None:
+    response = client.post(url, data="{", content_type="application/json")
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Malformed request body"}
+    cache_control = response.headers.get("Cache-Control")
+    assert cache_control == "max-age=0, no-cache, no-store, must-revalidate, private"
+
+
 @endpoints
 def test_returns_unprocessable_entity_when_non_dictionary_in_body(
     client: Client, url: str
@@ -413,6 +477,16 @@ class TestAuthFlow:
             self.check_transaction_is_complete(client, transaction_id)
             self.verify_transaction_is_consumed(client, transaction_id)
 
+    def test_transaction_id_is_signed_storage_key(self, client: Client) -> None:
+        self.valid_auth()
+        transaction_id = self.start_auth_login_action(client)
+        payload = transaction_signer.unsign(transaction_id)
+        assert payload == IsStr(regex=r"[0-9a-f]{32}")
+        assert (
+            bankid_sdk.config.STORAGE.load(bankid_sdk.TransactionID(payload))
+            is not None
+        )
+
     def start_auth(self, client: Client, body: dict[str, Any]) -> str:
         with does_call((bankid_mock["auth"], 1)):
             response = client.post(
@@ -428,10 +502,6 @@ class TestAuthFlow:
             "transaction_id": IsStr(min_length=1),
             "auto_start_token": IsStr(min_length=1),
         }
-        payload = TimestampSigner(
-            salt="bankid_sdk.contrib.django.transaction"
-        ).unsign_object(response_data["transaction_id"])
-        assert payload == IsUUID(4)
 
         call = bankid_mock["auth"].calls.last
         assert (
@@ -447,10 +517,8 @@ class TestAuthFlow:
         call = bankid_mock["auth"].calls.last
         assert json.loads(call.request.content) == IsPartialDict(
             endUserIp="192.168.1.1",
-            userVisibleData=b64encode(b"dummy_login_action_visible_auth_data").decode(),
-            userNonVisibleData=b64encode(
-                b"dummy_login_action_non_visible_auth_data"
-            ).decode(),
+            userVisibleData=LOGIN_VISIBLE_DATA,
+            userNonVisibleData=LOGIN_NON_VISIBLE_DATA,
         )
         return transaction_id
 
@@ -0,0 +1,24 @@
+from bankid_sdk._storage import AsyncStorage
+from bankid_sdk.contrib.django.storage import CacheStorage
+from tests.factories import TransactionFactory
+
+
+class TestCacheStorage:
+    def test_can_save_load_and_delete(self) -> None:
+        storage = CacheStorage()
+        transaction = TransactionFactory()
+        transaction_id = storage.save(transaction)
+        assert storage.load(transaction_id) == transaction
+        storage.delete(transaction_id)
+        assert storage.load(transaction_id) is None
+
+    async def test_can_save_load_and_delete_async(self) -> None:
+        storage = CacheStorage()
+        transaction = TransactionFactory()
+        transaction_id = await storage.asave(transaction)
+        assert await storage.aload(transaction_id) == transaction
+        await storage.adelete(transaction_id)
+        assert await storage.aload(transaction_id) is None
+
+    def test_is_an_async_storage(self) -> None:
+        assert isinstance(CacheStorage(), AsyncStorage)
@@ -45,3 +45,16 @@ class TestConfigure:
         bankid_sdk.configure()
         with pytest.raises(ConfigurationError, match=r"API_BASE_URL"):
             _ = bankid_sdk.config.API_BASE_URL
+
+    def test_registers_actions_by_operation_and_name(self) -> None:
+        class Login(bankid_sdk.AuthAction):
+            name = "LOGIN"
+
+        class Approve(bankid_sdk.SignAction):
+            name = "APPROVE"
+
+        bankid_sdk.configure(actions=[Login, Approve])
+        assert bankid_sdk.config.ACTIONS == {
+            "auth": {"LOGIN": Login},
+            "sign": {"APPROVE": Approve},
+        }
@@ -15,7 +15,7 @@ class DummyClient:
 
     def get_exc_hooks(self) -> list[AbstractContextManager[None]]:
         self.get_exc_hooks_call_count += 1
-        return [httpx_error_hook()]
+        return []
 
 
 class TestHttpxErrorHook:
@@ -71,3 +71,7 @@ class TestHttpxErrorHook:
 
         with pytest.raises(BankIDHTTPError):
             throw_httpx_http_error(DummyClient())
+
+    def test_hook_raises_bankid_http_error_on_httpx_http_error(self) -> None:
+        with pytest.raises(BankIDHTTPError), httpx_error_hook():
+            raise httpx.NetworkError("net not working")
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import bankid_sdk
+
+
+class TestLazyNamespace:
+    def test_all_public_names_are_resolvable(self) -> None:
+        for name in bankid_sdk.__all__:
+            assert getattr(bankid_sdk, name) is not None
+
+    def test_raises_attribute_error_for_unknown_name(self) -> None:
+        with pytest.raises(AttributeError, match=r"has no attribute 'Unknown'"):
+            _ = bankid_sdk.Unknown
+
+    def test_dir_lists_public_names(self) -> None:
+        assert dir(bankid_sdk) == sorted(bankid_sdk.__all__)
+
+    def test_import_does_not_load_submodules(self) -> None:
+        code = (
+            "import sys, bankid_sdk; "
+            "assert 'bankid_sdk._client' not in sys.modules; "
+            "assert 'httpx' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+    def test_public_submodules_are_reachable_as_attributes(self) -> None:
+        module = bankid_sdk.__getattr__("errors")
+        assert module is sys.modules["bankid_sdk.errors"]
+        code = (
+            "import bankid_sdk; "
+            "assert bankid_sdk.errors.InvalidParameters; "
+            "assert bankid_sdk.typing.OrderRef; "
+            "assert bankid_sdk.utils.dataclass_slots is not None"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -1,6 +1,15 @@
 import bankid_sdk
+from tests.factories import TransactionFactory
 
 
 class TestMemoryStorage:
     def test_load_returns_none_for_unknown_key(self) -> None:
         assert bankid_sdk.MemoryStorage().load(bankid_sdk.TransactionID("ID")) is None
+
+    async def test_can_save_load_and_delete_async(self) -> None:
+        storage = bankid_sdk.MemoryStorage()
+        transaction = TransactionFactory()
+        transaction_id = await storage.asave(transaction)
+        assert await storage.aload(transaction_id) == transaction
+        await storage.adelete(transaction_id)
+        assert await storage.aload(transaction_id) is None
@@ -223,6 +223,31 @@ def test_raises_value_error_if_personal_number_includes_non_digits_sync(
         sync_v60.auth(**kwargs)
 
 
+@contextmanager
+def value_error_if_personal_number_includes_non_ascii_digits_context() -> (
+    Generator[dict[str, Any], None, None]
+):
+    with pytest.raises(ValueError, match=r"Personal number includes non digits"):
+        yield {
+            "end_user_ip": "127.0.0.1",
+            "requirement": Requirement(personal_number="1" * 11 + "\u0661"),
+        }
+
+
+async def test_raises_value_error_if_personal_number_includes_non_ascii_digits_async(
+    async_v60: AsyncV60,
+) -> None:
+    with value_error_if_personal_number_includes_non_ascii_digits_context() as kwargs:
+        await async_v60.auth(**kwargs)
+
+
+def test_raises_value_error_if_personal_number_includes_non_ascii_digits_sync(
+    sync_v60: SyncV60,
+) -> None:
+    with value_error_if_personal_number_includes_non_ascii_digits_context() as kwargs:
+        sync_v60.auth(**kwargs)
+
+
 @contextmanager
 def value_error_if_encoded_user_visible_data_exceeds_1500_context() -> (
     Generator[dict[str, Any], None, None]
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import json
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -7,11 +9,14 @@ import httpx
 import pytest
 from dirty_equals import Contains
 
+import bankid_sdk
 from bankid_sdk import (
     AsyncV60,
     OrderRef,
     SyncV60,
 )
+from bankid_sdk.errors import InvalidParameters
+from tests.factories import TransactionFactory
 from tests.mocks import bankid_mock
 
 pytestmark = pytest.mark.usefixtures("mock_bankid")
@@ -41,3 +46,60 @@ async def test_can_send_cancel_request_async(async_v60: AsyncV60) -> None:
 def test_can_send_cancel_request_sync(sync_v60: SyncV60) -> None:
     with can_send_cancel_request_context() as order_ref:
         sync_v60.cancel(order_ref)
+
+
+class SyncOnlyStorage:
+    def __init__(self) -> None:
+        self.storage = bankid_sdk.MemoryStorage()
+
+    def save(self, obj: bankid_sdk.Transaction, /) -> bankid_sdk.TransactionID:
+        return self.storage.save(obj)
+
+    def load(self, key: bankid_sdk.TransactionID, /) -> bankid_sdk.Transaction | None:
+        return self.storage.load(key)
+
+    def delete(self, key: bankid_sdk.TransactionID, /) -> None:
+        self.storage.delete(key)
+
+
+@pytest.mark.parametrize(
+    "storage", [bankid_sdk.MemoryStorage(), SyncOnlyStorage()], ids=["async", "sync"]
+)
+async def test_acancel_cancels_order_and_deletes_transaction(
+    async_v60: AsyncV60, storage: bankid_sdk.MemoryStorage | SyncOnlyStorage
+) -> None:
+    bankid_sdk.configure(storage=storage)
+    transaction = TransactionFactory()
+    transaction_id = storage.save(transaction)
+    bankid_mock["cancel"].return_value = httpx.Response(HTTPStatus.OK, json={})
+
+    await bankid_sdk.acancel(async_v60, transaction_id)
+
+    assert bankid_mock["cancel"].call_count == 1
+    request = bankid_mock["cancel"].calls.last.request
+    assert json.loads(request.content) == {
+        "orderRef": transaction.order_response.order_ref
+    }
+    assert storage.load(transaction_id) is None
+
+
+async def test_acancel_skips_unknown_transaction(async_v60: AsyncV60) -> None:
+    bankid_sdk.configure(storage=bankid_sdk.MemoryStorage())
+    await bankid_sdk.acancel(async_v60, bankid_sdk.TransactionID("unknown"))
+    assert bankid_mock["cancel"].call_count == 0
+
+
+async def test_acancel_keeps_transaction_when_cancel_fails(
+    async_v60: AsyncV60,
+) -> None:
+    storage = bankid_sdk.MemoryStorage()
+    bankid_sdk.configure(storage=storage)
+    transaction_id = storage.save(TransactionFactory())
+    bankid_mock["cancel"].return_value = httpx.Response(
+        HTTPStatus.BAD_REQUEST, json={"errorCode": "invalidParameters"}
+    )
+
+    with pytest.raises(InvalidParameters):
+        await bankid_sdk.acancel(async_v60, transaction_id)
+
+    assert storage.load(transaction_id) is not None
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+import bankid_sdk
+from bankid_sdk import AsyncV60, OrderRef, SyncV60
+from bankid_sdk._client import order_ref_body
+
+
+@pytest.mark.parametrize(
+    ("component", "expected"),
+    [
+        pytest.param("/auth", SyncV60.AUTH_PATH),
+        pytest.param("sign", SyncV60.SIGN_PATH),
+        pytest.param("/collect", SyncV60.COLLECT_PATH),
+        pytest.param("cancel", SyncV60.CANCEL_PATH),
+    ],
+)
+def test_build_path_prefixes_component(
+    sync_v60: SyncV60, component: str, expected: str
+) -> None:
+    assert sync_v60.build_path(component) == expected
+
+
+@pytest.mark.parametrize("order_ref", ["ref", 'quoted"ref', "åäö"])
+def test_order_ref_body_is_valid_json(order_ref: str) -> None:
+    assert json.loads(order_ref_body(OrderRef(order_ref))) == {"orderRef": order_ref}
+
+
+async def test_default_client_uses_configured_values(fixtures_dir: Path) -> None:
+    bankid_sdk.configure(
+        api_base_url="https://example.com/",
+        certificate=(
+            str(fixtures_dir / "fake_cert.pem"),
+            str(fixtures_dir / "fake_client.key"),
+        ),
+        ca_cert=str(fixtures_dir / "fake_cacert.crt"),
+    )
+    async with AsyncV60.default_client() as client:
+        assert client.base_url == "https://example.com/"
+        assert client.timeout == httpx.Timeout(10.0, connect=3.0)
+
+
+def test_sync_default_client_uses_configured_values(fixtures_dir: Path) -> None:
+    bankid_sdk.configure(
+        api_base_url="https://example.com/",
+        certificate=(
+            str(fixtures_dir / "fake_cert.pem"),
+            str(fixtures_dir / "fake_client.key"),
+        ),
+        ca_cert=str(fixtures_dir / "fake_cacert.crt"),
+    )
+    with SyncV60.default_client() as client:
+        assert client.base_url == "https://example.com/"
+        assert client.timeout == httpx.Timeout(10.0, connect=3.0)
@@ -204,6 +204,22 @@ def test_sync_failed_collect_can_recognise_hint_code(
         gen.send(response)
 
 
+def test_raises_value_error_on_unknown_status(sync_v60: SyncV60) -> None:
+    bankid_mock["collect"].return_value = httpx.Response(
+        HTTPStatus.OK, json={"orderRef": "ref", "status": "unknown"}
+    )
+    with pytest.raises(ValueError, match=r"Unknown collect status 'unknown'"):
+        sync_v60.collect(OrderRef("ref"))
+
+
+def test_raises_value_error_on_non_string_status(sync_v60: SyncV60) -> None:
+    bankid_mock["collect"].return_value = httpx.Response(
+        HTTPStatus.OK, json={"orderRef": "ref", "status": ["pending"]}
+    )
+    with pytest.raises(ValueError, match=r"Unknown collect status \['pending'\]"):
+        sync_v60.collect(OrderRef("ref"))
+
+
 @pytest.mark.xfail(
     reason="Support BankID's custom _date_ format Z suffix", raises=AssertionError
 )
@@ -167,3 +167,30 @@ async def test_can_add_additional_exception_handling(
     )
     with pytest.raises(CustomException):
         await async_v60.collect(bankid_sdk.OrderRef("REF"))
+
+
+def test_activates_multiple_exception_hooks_in_order(
+    sync_v60: bankid_sdk.SyncV60,
+) -> None:
+    entered: list[str] = []
+    caught: list[tuple[str, type[BaseException]]] = []
+
+    @contextmanager
+    def record(name: str) -> Generator[None, None, None]:
+        entered.append(name)
+        try:
+            yield
+        except Exception as exc:
+            caught.append((name, type(exc)))
+            raise
+
+    sync_v60.handle(record("first")).handle(record("second"))
+
+    bankid_mock["collect"].return_value = httpx.Response(
+        HTTPStatus.BAD_REQUEST, json={"errorCode": "invalidParameters"}
+    )
+    with pytest.raises(InvalidParameters):
+        sync_v60.collect(bankid_sdk.OrderRef("REF"))
+
+    assert entered == ["first", "second"]
+    assert caught == [("second", InvalidParameters), ("first", InvalidParameters)]